@@ -1,5 +1,6 @@
 from istorage import IStorage
 from omdb_client import get_movie_by_title  # Import our OMDb API function
+from poster_sync import sync_posters, get_local_posters
 
 
 def get_int(prompt):
@@ -150,13 +151,38 @@ class MovieApp:
         else:
             print("Movie not found.")
 
+    def _command_sync_posters(self):
+        """
+        Downloads the posters of all stored movies into the local poster cache.
+
+        Posters that are already cached are only revalidated, and the bytes and time
+        saved by not downloading them again are reported.
+        """
+        movies = self._storage.get_movies()
+        try:
+            summary = sync_posters(movies)
+        except Exception as e:
+            print(f"Error syncing posters: {e}")
+            return
+        print(
+            f"Posters synced in {summary['elapsed']:.2f}s: "
+            f"{summary['downloaded']} downloaded, {summary['cached']} up to date, "
+            f"{summary['failed']} failed."
+        )
+        print(
+            f"Downloaded {summary['bytes_downloaded']} bytes, "
+            f"saved {summary['bytes_saved']} bytes and {summary['time_saved']:.2f}s from the cache."
+        )
+
     def _command_generate_website(self):
         """
         Generates a website using an HTML template.
 
         Reads the template file from _static/index_template.html, replaces the placeholders:
         __TEMPLATE_TITLE__ with the website title and __TEMPLATE_MOVIE_GRID__ with HTML for
-        each movie. The resulting HTML is written to index.html.
+        each movie. Posters mirrored into the local cache are referenced by their local
+        path, other posters fall back to their original URL. The resulting HTML is
+        written to index.html.
         """
         template_path = "_static/index_template.html"
         output_path = "index.html"
@@ -174,11 +200,18 @@ class MovieApp:
 
         # Build movie grid HTML by iterating over movies from storage
         movies = self._storage.get_movies()
+        try:
+            local_posters = get_local_posters()
+        except Exception as e:
+            print(f"Error reading local posters, using poster URLs: {e}")
+            local_posters = {}
         movie_grid = ""
         for movie in movies:
+            poster = movie.get("poster", "")
+            poster = local_posters.get(poster, poster)
             movie_item = (
                 f'<div class="movie">\n'
-                f'  <img src="{movie.get("poster", "")}" alt="{movie["title"]} poster">\n'
+                f'  <img src="{poster}" alt="{movie["title"]} poster">\n'
                 f'  <h2>{movie["title"]}</h2>\n'
                 f'  <p>Year: {movie["year"]}</p>\n'
                 f'  <p>Rating: {movie["rating"]}</p>\n'
@@ -216,6 +249,7 @@ class MovieApp:
             "3": self._command_delete_movie,
             "4": self._command_update_movie,
             "5": self._command_add_movie_api,
+            "6": self._command_sync_posters,
             "9": self._command_generate_website,
             "0": self._exit_app,
         }
@@ -228,6 +262,7 @@ class MovieApp:
             print("3. Delete Movie")
             print("4. Update Movie")
             print("5. Add Movie (via OMDb API)")
+            print("6. Sync posters (local cache)")
             print("9. Generate website")
 
             choice = get_str("Choose an option: ")
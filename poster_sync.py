@@ -0,0 +1,266 @@
+"""
+poster_sync.py
+
+This module mirrors movie poster images into a local, content-addressed cache so the
+generated website does not have to hotlink a third-party host. Posters are downloaded
+concurrently over a shared HTTP session, stored under the SHA-256 hash of their content
+(so identical images are only kept once) and revalidated on later runs with conditional
+requests (If-None-Match / If-Modified-Since).
+"""
+
+import hashlib
+import json
+import mimetypes
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Default directory for cached posters, relative to the generated index.html
+POSTER_DIR = "_static/posters"
+
+# Name of the file (inside the poster directory) mapping poster URLs to cached files
+MANIFEST_NAME = "manifest.json"
+
+# File extensions accepted when taken directly from the poster URL
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
+
+
+def _load_manifest(poster_dir):
+    """
+    Loads the poster manifest from the poster directory.
+
+    Args:
+        poster_dir (str): The directory holding the cached posters.
+
+    Returns:
+        dict: A dictionary mapping poster URLs to their cache entries. An empty
+              dictionary is returned if the manifest is missing or invalid, and
+              malformed entries are left out.
+    """
+    manifest_path = os.path.join(poster_dir, MANIFEST_NAME)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as fileobj:
+            manifest = json.load(fileobj)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if not isinstance(manifest, dict):
+        return {}
+    return {
+        url: entry
+        for url, entry in manifest.items()
+        if isinstance(entry, dict) and isinstance(entry.get("file"), str)
+    }
+
+
+def _write_manifest(poster_dir, manifest):
+    """
+    Writes the poster manifest to the poster directory.
+
+    Args:
+        poster_dir (str): The directory holding the cached posters.
+        manifest (dict): A dictionary mapping poster URLs to their cache entries.
+    """
+    manifest_path = os.path.join(poster_dir, MANIFEST_NAME)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fileobj:
+        json.dump(manifest, fileobj, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+
+def _guess_extension(url, content_type):
+    """
+    Determines the file extension for a downloaded poster.
+
+    Args:
+        url (str): The poster URL.
+        content_type (str): The Content-Type header of the response, if any.
+
+    Returns:
+        str: The file extension including the leading dot, or an empty string.
+    """
+    extension = os.path.splitext(urlparse(url).path)[1].lower()
+    if extension in IMAGE_EXTENSIONS:
+        return extension
+    if content_type:
+        guessed = mimetypes.guess_extension(content_type.split(";")[0].strip())
+        if guessed:
+            return guessed
+    return ""
+
+
+def _fetch_poster(session, url, entry, poster_dir, timeout):
+    """
+    Downloads a single poster, or revalidates it if a cached copy exists.
+
+    Args:
+        session (requests.Session): The shared HTTP session.
+        url (str): The poster URL.
+        entry (dict): The existing manifest entry for the URL, or None.
+        poster_dir (str): The directory holding the cached posters.
+        timeout (float): The request timeout in seconds.
+
+    Returns:
+        tuple: A (status, entry, elapsed) tuple where status is "downloaded",
+               "cached" or "failed", entry is the manifest entry to keep (or None)
+               and elapsed is the time spent on the request in seconds.
+    """
+    headers = {}
+    if entry and os.path.exists(os.path.join(poster_dir, entry["file"])):
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    else:
+        entry = None
+
+    start = time.perf_counter()
+    try:
+        response = session.get(url, headers=headers, timeout=timeout)
+        if entry and response.status_code == 304:
+            return "cached", entry, time.perf_counter() - start
+        response.raise_for_status()
+        if not 200 <= response.status_code < 300:
+            raise requests.HTTPError(f"Unexpected status {response.status_code}", response=response)
+        content = response.content
+    except requests.RequestException as e:
+        print(f"Error downloading poster {url}: {e}")
+        return "failed", entry, time.perf_counter() - start
+    elapsed = time.perf_counter() - start
+
+    digest = hashlib.sha256(content).hexdigest()
+    file_name = digest + _guess_extension(url, response.headers.get("Content-Type"))
+    file_path = os.path.join(poster_dir, file_name)
+    # Identical images share one file, so only write content we have not seen yet
+    if not os.path.exists(file_path):
+        tmp_path = f"{file_path}.{os.getpid()}.{id(response)}.tmp"
+        try:
+            with open(tmp_path, "wb") as fileobj:
+                fileobj.write(content)
+            os.replace(tmp_path, file_path)
+        except OSError as e:
+            print(f"Error writing poster {url}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return "failed", entry, elapsed
+
+    new_entry = {
+        "file": file_name,
+        "size": len(content),
+        "elapsed": elapsed,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    return "downloaded", new_entry, elapsed
+
+
+def _remove_unreferenced(poster_dir, manifest):
+    """
+    Deletes cached files that no manifest entry refers to.
+
+    Args:
+        poster_dir (str): The directory holding the cached posters.
+        manifest (dict): A dictionary mapping poster URLs to their cache entries.
+    """
+    referenced = {entry["file"] for entry in manifest.values()}
+    referenced.add(MANIFEST_NAME)
+    for file_name in os.listdir(poster_dir):
+        file_path = os.path.join(poster_dir, file_name)
+        if file_name not in referenced and os.path.isfile(file_path):
+            try:
+                os.remove(file_path)
+            except OSError as e:
+                print(f"Error removing stale poster {file_name}: {e}")
+
+
+def sync_posters(movies, poster_dir=POSTER_DIR, max_workers=8, timeout=10):
+    """
+    Mirrors the posters of the given movies into the local cache.
+
+    Every distinct http(s) poster URL is fetched once by a bounded pool of worker
+    threads sharing a single connection-pooling session. Posters already in the cache
+    are revalidated with a conditional request and are not downloaded again unless
+    the server reports a change. Entries for posters no longer in the list, and
+    cached files nothing refers to anymore, are removed.
+
+    Args:
+        movies (list): A list of movie dictionaries with an optional 'poster' key.
+        poster_dir (str): The directory holding the cached posters.
+        max_workers (int): The maximum number of concurrent downloads.
+        timeout (float): The request timeout in seconds.
+
+    Returns:
+        dict: A summary with the keys 'downloaded', 'cached', 'failed',
+              'bytes_downloaded', 'bytes_saved', 'time_saved' and 'elapsed'.
+    """
+    start = time.perf_counter()
+    os.makedirs(poster_dir, exist_ok=True)
+    manifest = _load_manifest(poster_dir)
+
+    urls = list(dict.fromkeys(
+        movie.get("poster", "")
+        for movie in movies
+        if urlparse(movie.get("poster", "")).scheme in ("http", "https")
+    ))
+    manifest = {url: manifest[url] for url in urls if url in manifest}
+
+    summary = {
+        "downloaded": 0,
+        "cached": 0,
+        "failed": 0,
+        "bytes_downloaded": 0,
+        "bytes_saved": 0,
+        "time_saved": 0.0,
+        "elapsed": 0.0,
+    }
+    try:
+        if urls:
+            workers = max(1, min(max_workers, len(urls)))
+            adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+            with requests.Session() as session:
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = executor.map(
+                        lambda url: _fetch_poster(session, url, manifest.get(url), poster_dir, timeout),
+                        urls,
+                    )
+                    for url, (status, entry, elapsed) in zip(urls, results):
+                        summary[status] += 1
+                        if entry is None:
+                            manifest.pop(url, None)
+                            continue
+                        manifest[url] = entry
+                        if status == "downloaded":
+                            summary["bytes_downloaded"] += entry.get("size", 0)
+                        elif status == "cached":
+                            summary["bytes_saved"] += entry.get("size", 0)
+                            summary["time_saved"] += max(entry.get("elapsed", 0.0) - elapsed, 0.0)
+    finally:
+        # Keep every finished entry even if the sync was interrupted
+        _write_manifest(poster_dir, manifest)
+
+    _remove_unreferenced(poster_dir, manifest)
+    summary["elapsed"] = time.perf_counter() - start
+    return summary
+
+
+def get_local_posters(poster_dir=POSTER_DIR):
+    """
+    Returns the locally cached posters that are present on disk.
+
+    Args:
+        poster_dir (str): The directory holding the cached posters.
+
+    Returns:
+        dict: A dictionary mapping poster URLs to the relative path of the cached file.
+    """
+    local_posters = {}
+    for url, entry in _load_manifest(poster_dir).items():
+        file_path = os.path.join(poster_dir, entry["file"])
+        if os.path.exists(file_path):
+            local_posters[url] = file_path.replace(os.sep, "/")
+    return local_posters
@@ -0,0 +1,126 @@
+import functools
+import hashlib
+import json
+import os
+import threading
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+import pytest
+
+from poster_sync import MANIFEST_NAME, sync_posters, get_local_posters
+
+POSTER_BYTES = b"\xff\xd8\xff\xe0" + b"poster" * 500
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """
+    Static file handler that does not log every request to stderr.
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def poster_server(tmp_path):
+    """
+    Serves the files of a temporary directory over HTTP on a free local port.
+
+    Yields:
+        tuple: The base URL of the server and the directory it serves.
+    """
+    served_dir = tmp_path / "served"
+    served_dir.mkdir()
+    (served_dir / "a.jpg").write_bytes(POSTER_BYTES)
+    (served_dir / "b.jpg").write_bytes(POSTER_BYTES)
+    handler = functools.partial(QuietHandler, directory=str(served_dir))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", served_dir
+    server.shutdown()
+    server.server_close()
+
+
+def read_manifest(poster_dir):
+    with open(os.path.join(poster_dir, MANIFEST_NAME), "r", encoding="utf-8") as fileobj:
+        return json.load(fileobj)
+
+
+def test_identical_posters_are_stored_once(poster_server, tmp_path):
+    base_url, _ = poster_server
+    poster_dir = str(tmp_path / "posters")
+    movies = [{"poster": f"{base_url}/a.jpg"}, {"poster": f"{base_url}/b.jpg"}]
+
+    summary = sync_posters(movies, poster_dir=poster_dir)
+
+    digest = hashlib.sha256(POSTER_BYTES).hexdigest()
+    assert summary["downloaded"] == 2
+    assert sorted(os.listdir(poster_dir)) == sorted([f"{digest}.jpg", MANIFEST_NAME])
+    manifest = read_manifest(poster_dir)
+    assert set(manifest) == {f"{base_url}/a.jpg", f"{base_url}/b.jpg"}
+    assert all(entry["file"] == f"{digest}.jpg" for entry in manifest.values())
+
+
+def test_second_run_revalidates_cached_posters(poster_server, tmp_path):
+    base_url, _ = poster_server
+    poster_dir = str(tmp_path / "posters")
+    movies = [{"poster": f"{base_url}/a.jpg"}, {"poster": f"{base_url}/b.jpg"}]
+
+    sync_posters(movies, poster_dir=poster_dir)
+    summary = sync_posters(movies, poster_dir=poster_dir)
+
+    assert summary["cached"] == 2
+    assert summary["downloaded"] == 0
+    assert summary["bytes_saved"] > 0
+    assert summary["bytes_downloaded"] == 0
+
+
+def test_missing_poster_is_counted_as_failed(poster_server, tmp_path):
+    base_url, _ = poster_server
+    poster_dir = str(tmp_path / "posters")
+    movies = [{"poster": f"{base_url}/missing.jpg"}, {"poster": f"{base_url}/a.jpg"}]
+
+    summary = sync_posters(movies, poster_dir=poster_dir)
+
+    assert summary["failed"] == 1
+    assert summary["downloaded"] == 1
+    assert set(read_manifest(poster_dir)) == {f"{base_url}/a.jpg"}
+
+
+def test_get_local_posters_maps_urls_to_cached_files(poster_server, tmp_path):
+    base_url, _ = poster_server
+    poster_dir = str(tmp_path / "posters")
+    movies = [{"poster": f"{base_url}/a.jpg"}, {"poster": ""}]
+
+    sync_posters(movies, poster_dir=poster_dir)
+
+    digest = hashlib.sha256(POSTER_BYTES).hexdigest()
+    expected = os.path.join(poster_dir, f"{digest}.jpg").replace(os.sep, "/")
+    assert get_local_posters(poster_dir) == {f"{base_url}/a.jpg": expected}
+
+
+def test_dropped_and_changed_posters_are_removed(poster_server, tmp_path):
+    base_url, served_dir = poster_server
+    poster_dir = str(tmp_path / "posters")
+    sync_posters([{"poster": f"{base_url}/a.jpg"}], poster_dir=poster_dir)
+
+    new_bytes = b"\x89PNG" + b"changed" * 100
+    (served_dir / "b.jpg").write_bytes(new_bytes)
+    sync_posters([{"poster": f"{base_url}/b.jpg"}], poster_dir=poster_dir)
+
+    digest = hashlib.sha256(new_bytes).hexdigest()
+    assert sorted(os.listdir(poster_dir)) == sorted([f"{digest}.jpg", MANIFEST_NAME])
+    assert set(read_manifest(poster_dir)) == {f"{base_url}/b.jpg"}
+
+
+@pytest.mark.parametrize("manifest", [[], {"http://example.com/a.jpg": {"size": 1}}])
+def test_malformed_manifest_is_ignored(tmp_path, manifest):
+    poster_dir = tmp_path / "posters"
+    poster_dir.mkdir()
+    (poster_dir / MANIFEST_NAME).write_text(json.dumps(manifest), encoding="utf-8")
+
+    assert get_local_posters(str(poster_dir)) == {}
+    summary = sync_posters([], poster_dir=str(poster_dir))
+    assert summary["failed"] == 0
+    assert read_manifest(str(poster_dir)) == {}